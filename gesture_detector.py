@@ -1,9 +1,58 @@
 import cv2
 import mediapipe as mp
 import numpy as np
+import os
+from concurrent.futures import ThreadPoolExecutor
+from mediapipe.tasks import python as mp_tasks
+from mediapipe.tasks.python import vision as mp_vision
 from typing import Tuple, Optional, List
 import time
 
+# Hand landmarker model for the MediaPipe Tasks API (LIVE_STREAM mode).
+# Download from the MediaPipe model zoo and place next to this file; the
+# legacy mp.solutions.hands API is used when the model is absent.
+HAND_LANDMARKER_MODEL = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "hand_landmarker.task"
+)
+
+# Hand skeleton edges as an (n_edges, 2) index array, built once so the
+# renderer never touches MediaPipe's frozenset of tuples per frame
+HAND_EDGES = np.array(sorted(mp.solutions.hands.HAND_CONNECTIONS), dtype=np.int32)
+
+
+def _fist_kernel(lm: np.ndarray) -> bool:
+    """
+    Branchless fist test on a (21, 2) float32 landmark array.
+
+    Fingertip/PIP landmark indices: index 8/6, middle 12/10, ring 16/14,
+    pinky 20/18; thumb tip=4, MCP=2, index MCP=5. Y increases downward,
+    so tip_y > pip_y means the finger is curled.
+    """
+    curled = (
+        (lm[8, 1] > lm[6, 1])
+        + (lm[12, 1] > lm[10, 1])
+        + (lm[16, 1] > lm[14, 1])
+        + (lm[20, 1] > lm[18, 1])
+    )
+
+    # Thumb is curled if tip is close to palm (comparing x-coordinates)
+    thumb_mcp_x = lm[2, 0]
+    thumb_curled = abs(lm[4, 0] - thumb_mcp_x) < abs(lm[5, 0] - thumb_mcp_x)
+
+    # Fist detected if at least 3 fingers are curled and thumb is curled
+    return curled >= 3 and thumb_curled
+
+
+# JIT-compile the kernel when Numba is available; the pure-Python version
+# above is the fallback. Pre-warming with a dummy array forces the one-time
+# compile at import instead of in the middle of the camera loop.
+try:
+    from numba import njit
+    _fist_kernel = njit(cache=True, fastmath=True)(_fist_kernel)
+    _fist_kernel(np.zeros((21, 2), dtype=np.float32))
+except ImportError:
+    pass
+
 
 class GestureDetector:
     """
@@ -18,101 +67,203 @@ class GestureDetector:
             min_detection_confidence=0.5
         )
 
-        # Initialize MediaPipe Hands
+        # Initialize hand tracking. Prefer the Tasks API HandLandmarker in
+        # LIVE_STREAM mode: detect_async never blocks the frame loop and
+        # results arrive via callback (at most one frame stale, the
+        # accepted tradeoff for FPS). Fall back to the legacy synchronous
+        # solution API when the model asset has not been downloaded.
         self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=2,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
+        self.hands = None
+        self.hand_landmarker = None
+        self._latest_hand_result = None  # last LIVE_STREAM callback result
+        if os.path.exists(HAND_LANDMARKER_MODEL):
+            options = mp_vision.HandLandmarkerOptions(
+                base_options=mp_tasks.BaseOptions(
+                    model_asset_path=HAND_LANDMARKER_MODEL
+                ),
+                running_mode=mp_vision.RunningMode.LIVE_STREAM,
+                num_hands=2,
+                min_hand_detection_confidence=0.5,
+                min_tracking_confidence=0.5,
+                result_callback=self._on_hand_result
+            )
+            self.hand_landmarker = mp_vision.HandLandmarker.create_from_options(
+                options
+            )
+        else:
+            self.hands = self.mp_hands.Hands(
+                static_image_mode=False,
+                max_num_hands=2,
+                min_detection_confidence=0.5,
+                min_tracking_confidence=0.5
+            )
+
+        # Worker pool so the face and hand models run in parallel.
+        # Both .process() calls release the GIL inside MediaPipe's C++
+        # graph, so two threads give real overlap.
+        self._pool = ThreadPoolExecutor(max_workers=2)
 
         # Drawing utilities
         self.mp_drawing = mp.solutions.drawing_utils
-        self.mp_drawing_styles = mp.solutions.drawing_styles
+
+        # Normalized-to-pixel scale vector for the landmark renderer,
+        # built on first use and kept while the frame size is unchanged
+        self._px_scale = None
+
+        # Landmark rendering can be disabled entirely (headless or
+        # benchmark runs) - drawing the skeleton is pure overhead when
+        # nothing consumes it
+        self.render_landmarks = True
 
         # Alert state management
         self.alert_active = False
         self.alert_start_time = 0
         self.alert_duration = 2  # seconds
 
-    def is_fist(self, hand_landmarks) -> bool:
+        # Landmark caching: skip hand re-detection on stable frames.
+        # MediaPipe only re-runs its palm detector when tracking confidence
+        # drops; emulate that here by reusing the previous frame's results
+        # while the scene is static, revalidating every few frames.
+        self._last_hands = None
+        self._last_frame_small = None
+        self._stable_counter = 0
+        self._max_stable_skips = 3  # force re-detection at least every N frames
+        self._stability_threshold = 2.0  # mean absdiff on a 160x90 grayscale
+
+        # Face detection feeds nothing but the drawn boxes, so running it
+        # on every frame is wasted inference; run it every Nth frame and
+        # redraw the last result in between
+        self._face_stride = 3
+        self._face_tick = 0
+        self._last_face_results = None
+
+        # Static overlay geometry: text sizes are constant, so lay them
+        # out once instead of calling cv2.getTextSize every frame, and
+        # pre-render the info panel's background box as a template that
+        # is blitted onto the frame
+        self._alert_text = "ALERT: FIST DETECTED!"
+        self._alert_font = cv2.FONT_HERSHEY_SIMPLEX
+        self._alert_font_scale = 1.5
+        self._alert_thickness = 3
+        (self._alert_text_w, self._alert_text_h), _ = cv2.getTextSize(
+            self._alert_text, self._alert_font,
+            self._alert_font_scale, self._alert_thickness
+        )
+        self._info_panel_bg = np.zeros((90, 290, 3), dtype=np.uint8)
+        cv2.rectangle(self._info_panel_bg, (0, 0), (289, 89), (255, 255, 255), 2)
+
+        # Inference input size. The models resize internally to ~256px
+        # anyway, so feeding a 640x360 copy halves the color-conversion
+        # and preprocessing cost without hurting accuracy. Landmarks are
+        # normalized 0..1, so drawing on the full frame still works.
+        self._inference_size = (640, 360)
+
+        # Persistent inference buffers: resize and color conversion write
+        # into these instead of allocating ~700 KB of fresh arrays per
+        # frame, keeping the same cache lines hot across frames
+        infer_w, infer_h = self._inference_size
+        self._small_buf = np.empty((infer_h, infer_w, 3), dtype=np.uint8)
+        self._rgb_buf = np.empty((infer_h, infer_w, 3), dtype=np.uint8)
+
+        # Persistent landmark buffer, one row per tracked hand
+        # (max_num_hands=2). Landmarks are copied out of MediaPipe's
+        # per-landmark objects into this contiguous array once per hand,
+        # so everything downstream works on plain numeric data. Only x/y
+        # are stored (nothing reads z), and float16 is plenty: 1/1024
+        # relative precision is sub-pixel at 1280px.
+        self._lm_buf = np.empty((2, 21, 2), dtype=np.float16)
+
+        # float32 scratch row for the fist kernel, which is compiled for
+        # float32 (Numba has no CPU float16 support)
+        self._lm_f32 = np.empty((21, 2), dtype=np.float32)
+
+    def _extract_landmarks(self, idx: int, landmarks) -> np.ndarray:
+        """
+        Copy a hand landmark sequence into row idx of the persistent buffer.
+
+        A single pass over the landmark objects is much cheaper than
+        repeated per-landmark attribute access in the hot path, and
+        reusing the preallocated buffer means no per-hand allocation at
+        all. Works for both the Tasks API landmark lists and the legacy
+        protobuf field.
+
+        Args:
+            idx: Hand index (0 or 1) selecting the buffer row
+            landmarks: Sequence of 21 landmarks with .x/.y attributes
+
+        Returns:
+            np.ndarray: View of the buffer row, shape (21, 2)
+        """
+        buf = self._lm_buf[idx]
+        buf.ravel()[:] = np.fromiter(
+            (c for lm in landmarks for c in (lm.x, lm.y)),
+            dtype=np.float16,
+            count=42
+        )
+        return buf
+
+    def is_fist(self, lm: np.ndarray) -> bool:
         """
         Detect if the hand is making a fist gesture.
         A fist is detected when all fingertips are below their respective PIP joints.
 
         Args:
-            hand_landmarks: MediaPipe hand landmarks
+            lm: Landmark coordinates, shape (21, 2) of (x, y)
 
         Returns:
             bool: True if hand is making a fist, False otherwise
         """
-        # Get landmark coordinates
-        landmarks = hand_landmarks.landmark
-
-        # Finger tip and PIP joint indices
-        # Thumb: tip=4, IP=3
-        # Index: tip=8, PIP=6
-        # Middle: tip=12, PIP=10
-        # Ring: tip=16, PIP=14
-        # Pinky: tip=20, PIP=18
-
-        finger_tips = [8, 12, 16, 20]  # Index, Middle, Ring, Pinky
-        finger_pips = [6, 10, 14, 18]
-
-        # Check if all fingers are curled (tips below PIPs in y-coordinate)
-        fingers_curled = 0
-        for tip, pip in zip(finger_tips, finger_pips):
-            # Y increases downward in image coordinates
-            if landmarks[tip].y > landmarks[pip].y:
-                fingers_curled += 1
-
-        # Check thumb separately (different orientation)
-        thumb_tip = landmarks[4]
-        thumb_ip = landmarks[3]
-        thumb_mcp = landmarks[2]
-
-        # Thumb is curled if tip is close to palm (comparing x-coordinates)
-        thumb_curled = abs(thumb_tip.x - thumb_mcp.x) < abs(landmarks[5].x - thumb_mcp.x)
-
-        # Fist detected if at least 3 fingers are curled and thumb is curled
-        return fingers_curled >= 3 and thumb_curled
-
-    def is_left_hand(self, hand_landmarks, image_width: int) -> bool:
+        # Upcast into the persistent scratch row; the kernel is compiled
+        # for float32 and the copy is 42 values, allocation-free
+        self._lm_f32[:] = lm
+        return bool(_fist_kernel(self._lm_f32))
+
+    def is_left_hand(self, lm: np.ndarray, image_width: int) -> bool:
         """
         Determine if the detected hand is the left hand.
-        Uses the wrist and middle finger MCP positions.
+        Uses the wrist position.
 
         Args:
-            hand_landmarks: MediaPipe hand landmarks
+            lm: Landmark coordinates, shape (21, 2) of (x, y)
             image_width: Width of the image
 
         Returns:
             bool: True if left hand, False if right hand
         """
-        # Get wrist position
-        wrist = hand_landmarks.landmark[0]
-        # Get middle finger MCP (base)
-        middle_mcp = hand_landmarks.landmark[9]
-
         # Simple heuristic: if hand is on the left side of the image
         # and palm faces camera, it's likely the left hand
-        hand_center_x = wrist.x
+        hand_center_x = lm[0, 0]  # wrist x
 
         return hand_center_x < 0.5
 
-    def trigger_alert(self):
-        """Activate the alert state."""
+    def trigger_alert(self, now: float):
+        """
+        Activate the alert state.
+
+        Only the rising edge does any work: while the gesture is held the
+        alert fires every frame, and logging 30 times a second would just
+        hammer stdout.
+
+        Args:
+            now: Current time from time.monotonic()
+        """
+        if self.alert_active:
+            return
         self.alert_active = True
-        self.alert_start_time = time.time()
+        self.alert_start_time = now
         print("\n" + "="*50)
         print("ALERT: LEFT HAND FIST DETECTED!")
         print("="*50 + "\n")
 
-    def check_alert_timeout(self):
-        """Check if alert should be deactivated."""
+    def check_alert_timeout(self, now: float):
+        """
+        Check if alert should be deactivated.
+
+        Args:
+            now: Current time from time.monotonic()
+        """
         if self.alert_active:
-            if time.time() - self.alert_start_time > self.alert_duration:
+            if now - self.alert_start_time > self.alert_duration:
                 self.alert_active = False
 
     def draw_alert_overlay(self, image: np.ndarray) -> np.ndarray:
@@ -126,53 +277,147 @@ class GestureDetector:
             Image with alert overlay
         """
         if self.alert_active:
-            # Create semi-transparent red overlay
-            overlay = image.copy()
             height, width = image.shape[:2]
 
-            # Draw red border
-            cv2.rectangle(overlay, (0, 0), (width, height), (0, 0, 255), 30)
-
-            # Add alert text
-            alert_text = "ALERT: FIST DETECTED!"
-            font = cv2.FONT_HERSHEY_SIMPLEX
-            font_scale = 1.5
-            thickness = 3
+            # Draw the red border directly on the frame; blending a
+            # full-frame copy for an opaque border wasted ~2.6 MB of
+            # memory traffic per frame
+            cv2.rectangle(image, (0, 0), (width, height), (0, 0, 255), 30)
 
-            # Get text size
-            (text_width, text_height), baseline = cv2.getTextSize(
-                alert_text, font, font_scale, thickness
-            )
+            # Add alert text using the cached layout
+            alert_text = self._alert_text
+            font = self._alert_font
+            font_scale = self._alert_font_scale
+            thickness = self._alert_thickness
+            text_width = self._alert_text_w
+            text_height = self._alert_text_h
 
             # Position text at top center
             text_x = (width - text_width) // 2
             text_y = 80
 
-            # Draw background rectangle for text
-            cv2.rectangle(
-                overlay,
-                (text_x - 10, text_y - text_height - 10),
-                (text_x + text_width + 10, text_y + 10),
-                (0, 0, 255),
-                -1
-            )
+            # Blend only the text's bounding box, not the whole frame
+            x0 = max(text_x - 10, 0)
+            y0 = max(text_y - text_height - 10, 0)
+            x1 = min(text_x + text_width + 10, width)
+            y1 = min(text_y + 10, height)
+            roi = image[y0:y1, x0:x1]
 
-            # Draw text
+            banner = np.full_like(roi, (0, 0, 255))
             cv2.putText(
-                overlay,
+                banner,
                 alert_text,
-                (text_x, text_y),
+                (text_x - x0, text_y - y0),
                 font,
                 font_scale,
                 (255, 255, 255),
                 thickness
             )
-
-            # Blend overlay with original image
-            cv2.addWeighted(overlay, 0.7, image, 0.3, 0, image)
+            cv2.addWeighted(banner, 0.7, roi, 0.3, 0, roi)
 
         return image
 
+    def _to_pixels(self, lm: np.ndarray, width: int, height: int) -> np.ndarray:
+        """
+        Convert normalized landmarks to pixel coordinates in one multiply.
+
+        The cached scale vector turns all 21 conversions into a single
+        vectorized multiply + cast instead of per-coordinate Python math;
+        the result is shared by the renderer and the label placement.
+
+        Args:
+            lm: Landmark coordinates, shape (21, 2) of (x, y)
+            width: Frame width in pixels
+            height: Frame height in pixels
+
+        Returns:
+            np.ndarray: Pixel coordinates, shape (21, 2), int32
+        """
+        if self._px_scale is None or self._px_scale[0] != width:
+            self._px_scale = np.array((width, height), dtype=np.float32)
+        return (lm * self._px_scale).astype(np.int32)
+
+    def _draw_hand(self, frame: np.ndarray, pts: np.ndarray):
+        """
+        Draw the hand skeleton from pre-computed pixel coordinates.
+
+        Replaces mp_drawing.draw_landmarks: the per-frame work is just
+        the cheap cv2 line/circle primitives with no per-point protobuf
+        attribute access.
+
+        Args:
+            frame: Frame to draw on
+            pts: Pixel coordinates, shape (21, 2), int32
+        """
+        for a, b in HAND_EDGES:
+            cv2.line(frame, tuple(pts[a]), tuple(pts[b]), (0, 255, 0), 2)
+        for x, y in pts:
+            cv2.circle(frame, (int(x), int(y)), 4, (0, 0, 255), -1)
+
+    def _on_hand_result(self, result, output_image, timestamp_ms: int):
+        """LIVE_STREAM callback: stash the latest hand landmarker result."""
+        self._latest_hand_result = result
+
+    def _detect_hands(self, frame: np.ndarray, rgb_frame: np.ndarray) -> List[Tuple]:
+        """
+        Run hand detection, reusing the previous frame's results when the
+        scene is stable.
+
+        A cheap motion score (mean absolute difference of a 160x90 grayscale
+        thumbnail against the previous frame) decides whether the expensive
+        MediaPipe inference can be skipped. Detection is re-run whenever
+        motion is detected or after a few consecutive skips.
+
+        Args:
+            frame: BGR frame (any size; only used for the motion thumbnail)
+            rgb_frame: RGB frame for MediaPipe
+
+        Returns:
+            List of (landmark_sequence, handedness_label) per detected hand,
+            normalized across the Tasks and legacy solution APIs
+        """
+        small = cv2.resize(frame, (160, 90), interpolation=cv2.INTER_AREA)
+        gray_small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+        stable = False
+        if self._last_frame_small is not None and self._last_hands is not None:
+            motion = cv2.absdiff(gray_small, self._last_frame_small).mean()
+            stable = motion < self._stability_threshold
+        self._last_frame_small = gray_small
+
+        if stable and self._stable_counter < self._max_stable_skips:
+            self._stable_counter += 1
+            return self._last_hands
+
+        self._stable_counter = 0
+
+        hands = []
+        if self.hand_landmarker is not None:
+            # Tasks API: non-blocking dispatch, then read the newest
+            # result the callback has delivered so far
+            mp_image = mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
+            self.hand_landmarker.detect_async(
+                mp_image, int(time.monotonic() * 1000)
+            )
+            result = self._latest_hand_result
+            if result is not None:
+                for idx, landmarks in enumerate(result.hand_landmarks):
+                    label = ""
+                    if result.handedness:
+                        label = result.handedness[idx][0].category_name
+                    hands.append((landmarks, label))
+        else:
+            results = self.hands.process(rgb_frame)
+            if results.multi_hand_landmarks:
+                for idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
+                    label = ""
+                    if results.multi_handedness:
+                        label = results.multi_handedness[idx].classification[0].label
+                    hands.append((hand_landmarks.landmark, label))
+
+        self._last_hands = hands
+        return hands
+
     def process_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, dict]:
         """
         Process a single frame to detect faces and hand gestures.
@@ -183,8 +428,17 @@ class GestureDetector:
         Returns:
             Tuple of (processed_frame, detection_info)
         """
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # Sample the clock once per frame; time.monotonic() is immune to
+        # wall-clock jumps (NTP/DST) that would break alert timing
+        now = time.monotonic()
+
+        # Downscale once, then convert BGR to RGB for the models, reusing
+        # the persistent buffers to avoid per-frame allocations
+        small = cv2.resize(
+            frame, self._inference_size,
+            dst=self._small_buf, interpolation=cv2.INTER_LINEAR
+        )
+        rgb_frame = cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
         height, width, _ = frame.shape
 
         detection_info = {
@@ -193,62 +447,70 @@ class GestureDetector:
             'left_fist_detected': False
         }
 
-        # Detect faces
-        face_results = self.face_detection.process(rgb_frame)
-        if face_results.detections:
+        # Run face and hand detection in parallel; per-frame latency becomes
+        # max(t_face, t_hands) instead of their sum. Face detection is
+        # additionally subsampled: it only feeds the drawn boxes, so every
+        # _face_stride-th frame is plenty.
+        face_future = None
+        if self._face_tick % self._face_stride == 0:
+            face_future = self._pool.submit(self.face_detection.process, rgb_frame)
+        self._face_tick += 1
+        hand_future = self._pool.submit(self._detect_hands, small, rgb_frame)
+        if face_future is not None:
+            self._last_face_results = face_future.result()
+        face_results = self._last_face_results
+        hands = hand_future.result()
+
+        # Draw faces
+        if face_results is not None and face_results.detections:
             detection_info['faces_detected'] = len(face_results.detections)
             for detection in face_results.detections:
                 self.mp_drawing.draw_detection(frame, detection)
 
-        # Detect hands
-        hand_results = self.hands.process(rgb_frame)
-        if hand_results.multi_hand_landmarks:
-            detection_info['hands_detected'] = len(hand_results.multi_hand_landmarks)
+        if hands:
+            detection_info['hands_detected'] = len(hands)
+
+            for idx, (landmarks, hand_label) in enumerate(hands):
+                # Extract landmarks once; all downstream checks share this array
+                lm = self._extract_landmarks(idx, landmarks)
+
+                # One normalized-to-pixel conversion per hand, shared by
+                # the skeleton renderer and the label placement
+                pts = self._to_pixels(lm, width, height)
 
-            for idx, hand_landmarks in enumerate(hand_results.multi_hand_landmarks):
                 # Draw hand landmarks
-                self.mp_drawing.draw_landmarks(
+                if self.render_landmarks:
+                    self._draw_hand(frame, pts)
+
+                # Check if it's a fist
+                is_fist = self.is_fist(lm)
+                is_left = self.is_left_hand(lm, width)
+
+                # Draw hand label at the wrist (landmark 0)
+                label_x = int(pts[0, 0])
+                label_y = int(pts[0, 1]) - 20
+
+                label_text = f"{hand_label}"
+                if is_fist:
+                    label_text += " - FIST"
+
+                cv2.putText(
                     frame,
-                    hand_landmarks,
-                    self.mp_hands.HAND_CONNECTIONS,
-                    self.mp_drawing_styles.get_default_hand_landmarks_style(),
-                    self.mp_drawing_styles.get_default_hand_connections_style()
+                    label_text,
+                    (label_x, label_y),
+                    cv2.FONT_HERSHEY_SIMPLEX,
+                    0.7,
+                    (0, 255, 0) if not is_fist else (0, 0, 255),
+                    2
                 )
 
-                # Check if it's a fist
-                is_fist = self.is_fist(hand_landmarks)
-                is_left = self.is_left_hand(hand_landmarks, width)
-
-                # Get hand label from MediaPipe results
-                if hand_results.multi_handedness:
-                    hand_label = hand_results.multi_handedness[idx].classification[0].label
-
-                    # Draw hand label
-                    wrist = hand_landmarks.landmark[0]
-                    label_x = int(wrist.x * width)
-                    label_y = int(wrist.y * height) - 20
-
-                    label_text = f"{hand_label}"
-                    if is_fist:
-                        label_text += " - FIST"
-
-                    cv2.putText(
-                        frame,
-                        label_text,
-                        (label_x, label_y),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.7,
-                        (0, 255, 0) if not is_fist else (0, 0, 255),
-                        2
-                    )
-
-                    # Trigger alert if left hand fist detected
-                    if hand_label == "Left" and is_fist:
-                        detection_info['left_fist_detected'] = True
-                        self.trigger_alert()
+                # Trigger alert if left hand fist detected
+                if hand_label == "Left" and is_fist:
+                    detection_info['left_fist_detected'] = True
+                    self.trigger_alert(now)
 
         # Check alert timeout
-        self.check_alert_timeout()
+        self.check_alert_timeout(now)
 
         # Draw alert overlay
         frame = self.draw_alert_overlay(frame)
@@ -271,9 +533,8 @@ class GestureDetector:
         font_scale = 0.6
         thickness = 2
 
-        # Draw background for info panel
-        cv2.rectangle(frame, (10, 10), (300, 100), (0, 0, 0), -1)
-        cv2.rectangle(frame, (10, 10), (300, 100), (255, 255, 255), 2)
+        # Blit the pre-rendered background instead of re-rasterizing it
+        frame[10:100, 10:300] = self._info_panel_bg
 
         # Draw info text
         cv2.putText(
@@ -311,5 +572,9 @@ class GestureDetector:
 
     def cleanup(self):
         """Release resources."""
+        self._pool.shutdown(wait=True)
         self.face_detection.close()
-        self.hands.close()
\ No newline at end of file
+        if self.hand_landmarker is not None:
+            self.hand_landmarker.close()
+        else:
+            self.hands.close()
\ No newline at end of file